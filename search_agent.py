@@ -15,20 +15,33 @@ Key components:
 
 Dependencies:
 - ollama: AI model integration
-- requests: HTTP requests
-- trafilatura: Web scraping
-- beautifulsoup4: HTML parsing
+- httpx: HTTP/2 requests
+- trafilatura: Text extraction
+- selectolax: HTML parsing (C-backed lexbor engine)
 - colorama: Terminal colors
 """
 
+import asyncio
+import atexit
+import copy
+import hashlib
 import logging
+import os
+import re
+import sys
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock, Thread
 from typing import Dict, List, Optional
+from urllib.parse import urlencode
 
+import httpx
 import ollama
-import requests
 import trafilatura
-from bs4 import BeautifulSoup
+from cachetools import TTLCache
 from colorama import Fore, Style, init
+from rank_bm25 import BM25Okapi
+from selectolax.parser import HTMLParser
 
 import sys_msgs
 
@@ -36,6 +49,128 @@ import sys_msgs
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# How many search results to collect from a DuckDuckGo results page.
+MAX_SEARCH_RESULTS = 10
+
+USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'
+)
+
+# Shared HTTP/2 client: one TCP+TLS session multiplexes the search
+# request and the concurrent page fetches, beating even keep-alive
+# pooled HTTP/1.1, and pages are downloaded here instead of through
+# trafilatura's per-call urllib3 setup.
+# http2/limits must be set on the transport: Client ignores its own
+# http2= and limits= kwargs when an explicit transport is passed.
+_HTTP = httpx.Client(
+    timeout=10,
+    headers={'User-Agent': USER_AGENT},
+    transport=httpx.HTTPTransport(
+        http2=True,
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+    ),
+    follow_redirects=True,
+)
+atexit.register(_HTTP.close)
+
+# Cache DuckDuckGo results so repeat queries in a session skip the HTTP
+# round trip and HTML parse. TTL is configurable via DDG_CACHE_TTL
+# (seconds); 0 disables caching.
+# Set LLM_RERANK=1 to rank search results with the llama3.2 picker
+# instead of the default BM25 scoring.
+LLM_RERANK = os.environ.get('LLM_RERANK', '0') == '1'
+
+DDG_CACHE_TTL = int(os.environ.get('DDG_CACHE_TTL', '300'))
+_DDG_CACHE = TTLCache(maxsize=256, ttl=DDG_CACHE_TTL) if DDG_CACHE_TTL > 0 else None
+_DDG_LOCK = Lock()
+
+# Cache scraped pages by URL; the ai_search retry loop and repeat turns
+# can revisit the same link, and each miss costs a full HTTP GET plus a
+# CPU-heavy trafilatura extract. Failed scrapes are negative-cached with
+# a shorter TTL so dead links aren't hammered but can recover.
+_PAGE_CACHE = TTLCache(maxsize=512, ttl=900)
+_PAGE_MISS_CACHE = TTLCache(maxsize=512, ttl=60)
+_PAGE_LOCK = Lock()
+
+# trafilatura.extract is CPU-bound (lxml plus readability heuristics)
+# and holds the GIL, so the concurrent scrape fan-out would serialize on
+# it in threads. A process pool lets pages extract on separate cores;
+# it is created lazily so runs that never scrape skip the fork cost.
+_EXTRACT_POOL: Optional[ProcessPoolExecutor] = None
+_EXTRACT_POOL_LOCK = Lock()
+
+def _extract_pool() -> ProcessPoolExecutor:
+    """Create the shared extraction process pool on first use."""
+    global _EXTRACT_POOL
+    with _EXTRACT_POOL_LOCK:
+        if _EXTRACT_POOL is None:
+            _EXTRACT_POOL = ProcessPoolExecutor(max_workers=os.cpu_count())
+            atexit.register(_EXTRACT_POOL.shutdown)
+        return _EXTRACT_POOL
+
+def _extract_text(downloaded: str) -> Optional[str]:
+    """
+    Extract readable text from downloaded HTML.
+
+    Module-level (not a lambda) so it can be pickled for the process pool.
+
+    Args:
+        downloaded (str): Raw HTML as returned by the fetch
+
+    Returns:
+        Optional[str]: Extracted content if successful, None otherwise
+    """
+    return trafilatura.extract(downloaded, include_formatting=True)
+
+# Single-flight map: concurrent callers asking for the same key share one
+# in-flight fetch instead of each paying full network latency.
+_INFLIGHT: Dict[str, Future] = {}
+_INFLIGHT_LOCK = Lock()
+
+def _single_flight(key: str, work):
+    """
+    Run work() once per key, letting concurrent callers with the same key
+    wait on the first caller's Future instead of duplicating the call.
+
+    Args:
+        key (str): Deduplication key for the operation
+        work: Zero-argument callable performing the actual fetch
+
+    Returns:
+        The result of work(), shared across coalesced callers
+    """
+    with _INFLIGHT_LOCK:
+        existing = _INFLIGHT.get(key)
+        if existing is None:
+            fut = Future()
+            _INFLIGHT[key] = fut
+
+    if existing is not None:
+        return existing.result()
+
+    try:
+        result = work()
+        fut.set_result(result)
+        return result
+    except BaseException as e:
+        fut.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(key, None)
+
+# ANSI color codes are pure overhead (and break downstream tools) when
+# output is piped to a file or journald; honor the NO_COLOR convention
+# and only colorize real TTYs.
+_STDOUT_IS_TTY = sys.stdout.isatty()
+_COLOR_ENABLED = (
+    'NO_COLOR' not in os.environ
+    and _STDOUT_IS_TTY
+    and sys.stderr.isatty()
+)
+
 # Add color formatting to logging
 class ColoredFormatter(logging.Formatter):
     """Custom logging formatter that adds color to log messages based on level."""
@@ -50,34 +185,115 @@ class ColoredFormatter(logging.Formatter):
         logging.CRITICAL: Fore.RED + Style.BRIGHT + format_str + Style.RESET_ALL
     }
 
+    def __init__(self):
+        """Precompile one Formatter per level instead of building one per record."""
+        super().__init__(self.format_str)
+        self._formatters = {
+            level: logging.Formatter(fmt if _COLOR_ENABLED else self.format_str)
+            for level, fmt in self.FORMATS.items()
+        }
+
     def format(self, record):
         """Format the log record with appropriate color based on log level."""
-        log_fmt = self.FORMATS.get(record.levelno)
-        formatter = logging.Formatter(log_fmt)
+        formatter = self._formatters.get(record.levelno)
+        if formatter is None:
+            return super().format(record)
         return formatter.format(record)
 
 handler = logging.StreamHandler()
 handler.setFormatter(ColoredFormatter())
 logger.handlers = [handler]
 
-init(autoreset=True)
+if _COLOR_ENABLED:
+    init(autoreset=True)
+else:
+    # Strip any ANSI the prompt strings still emit so piped output and
+    # log files stay clean.
+    init(strip=True)
+
+# One shared Ollama client so every LLM call reuses the keep-alive HTTP
+# connection to the local server instead of building a new client per
+# call. keep_alive also pins llama3.2 in the server between calls,
+# avoiding a cold weight load per request.
+_OLLAMA = ollama.AsyncClient()
+OLLAMA_KEEP_ALIVE = '30m'
+
+# Explicit context size so the server allocates a bounded KV cache
+# instead of the model's maximum.
+OLLAMA_NUM_CTX = 4096
+
+# Keep the system prompt plus at most this many recent messages (8
+# user/assistant pairs); older turns get summarized away. Re-sending the
+# full history makes prefill cost grow quadratically with turn count.
+MAX_CONVO_MESSAGES = 16
+
+# JSON schemas for grammar-constrained decoding: the single-answer
+# agents can only emit a valid value, so no prose ever needs parsing
+# around and no retries are needed. num_predict stays tiny because the
+# constrained output is a handful of tokens (the enum strings include
+# their JSON quotes).
+_INDEX_FORMAT = {'type': 'integer', 'minimum': 0, 'maximum': 9}
+_BOOL_FORMAT = {'type': 'string', 'enum': ['True', 'False']}
 
 assistant_convo = [
-    sys_msgs.assistant_agent,  
+    sys_msgs.assistant_agent,
 ]
 
-def check_search_or_not() -> bool:
+# Obvious cases of the search/no-search decision are settled with cheap
+# regex heuristics so most turns skip the llama3.2 round trip entirely;
+# only ambiguous prompts fall through to the LLM.
+_SEARCH_HINTS = re.compile(
+    r'\b(today|tonight|yesterday|latest|current(ly)?|news|price|stock|'
+    r'weather|forecast|score|release date|version|20[2-9]\d|who won|'
+    r'how much (is|does)|near me)\b',
+    re.IGNORECASE,
+)
+_CHITCHAT_HINTS = re.compile(
+    r'^(hi|hello|hey|yo|thanks?( you)?|ok(ay)?|cool|nice|great|lol|bye|'
+    r'good (morning|afternoon|evening|night)|how are you\??)[\s.!?]*$',
+    re.IGNORECASE,
+)
+
+def _heuristic_search_decision(prompt: str) -> Optional[bool]:
+    """
+    Classify the obvious search/no-search cases without an LLM call.
+
+    Args:
+        prompt (str): The user's last message
+
+    Returns:
+        Optional[bool]: True/False when confident, None when ambiguous
+    """
+    text = prompt.strip()
+    if _CHITCHAT_HINTS.match(text):
+        return False
+    if _SEARCH_HINTS.search(text):
+        return True
+    return None
+
+async def check_search_or_not() -> bool:
     """
     Determine if a search should be performed based on the last conversation message.
-    
+
+    Tries the regex heuristics first and only asks the LLM when they
+    cannot decide.
+
     Returns:
         bool: True if search should be performed, False otherwise
     """
+    decision = _heuristic_search_decision(assistant_convo[-1]['content'])
+    if decision is not None:
+        logger.info(f'Search decision (heuristic): {decision}')
+        return decision
+
     sys_msg = sys_msgs.should_search_decision_agent
     try:
-        response = ollama.chat(
+        response = await _OLLAMA.chat(
             model="llama3.2",
-            messages=[sys_msg, {'role': 'user', 'content': assistant_convo[-1]['content']}]
+            messages=[sys_msg, {'role': 'user', 'content': assistant_convo[-1]['content']}],
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            format=_BOOL_FORMAT,
+            options={'num_predict': 4}
         )
         content = response['message']['content']
         logger.info(f'Search decision: {content}')
@@ -86,22 +302,23 @@ def check_search_or_not() -> bool:
         logger.error(f'Error in search decision: {e}')
         return False
 
-def query_generator() -> str:
+async def query_generator() -> str:
     """
     Generate a search query based on the last conversation message.
-    
+
     Returns:
         str: Generated search query
     """
     sys_msg = sys_msgs.search_query_generator_agent
     query = f'CREATE A SEARCH QUERY FOR THE FOLLOWING QUESTION: \n{assistant_convo[-1]["content"]}'
-    
+
 # site://nextjs.org/latest
 
     try:
-        response = ollama.chat(
+        response = await _OLLAMA.chat(
             model="llama3.2",
-            messages=[sys_msg, {'role': 'user', 'content': query}]
+            messages=[sys_msg, {'role': 'user', 'content': query}],
+            keep_alive=OLLAMA_KEEP_ALIVE
         )
         content = response['message']['content']
         print(f'CONTENT: {content}')
@@ -120,70 +337,127 @@ def search_duckduckgo(search_query: str) -> List[Dict]:
     Returns:
         List[Dict]: List of search results, each containing id, link and description
     """
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.36'
-    }
+    cache_key = search_query.strip().lower()
+    if _DDG_CACHE is not None:
+        with _DDG_LOCK:
+            cached = _DDG_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info(f'Returning {len(cached)} cached search results')
+            return copy.deepcopy(cached)
+
+    results = _single_flight(
+        f'ddg:{cache_key}',
+        lambda: _fetch_search_results(search_query, cache_key),
+    )
+    return copy.deepcopy(results)
+
+def _fetch_search_results(search_query: str, cache_key: str) -> List[Dict]:
+    """
+    Fetch and parse DuckDuckGo results, populating the TTL cache.
+
+    Args:
+        search_query (str): Query string to search for
+        cache_key (str): Normalized key to store results under
+
+    Returns:
+        List[Dict]: Parsed search results
+    """
     try:
-        url = f'https://duckduckgo.com/html/?q={search_query}'
+        url = 'https://duckduckgo.com/html/?' + urlencode({'q': search_query})
         print(f'URL: {url}')
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _HTTP.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
+        tree = HTMLParser(response.text)
         results = []
-        
-        for i, result in enumerate(soup.find_all('div', class_='result'), start=0):
-            if i >= 10:
+
+        # lexbor parses the document in one C pass, so the win here is
+        # stopping the per-node Python work as soon as enough results
+        # are collected rather than walking every result div.
+        for result in tree.css('div.result'):
+            if len(results) >= MAX_SEARCH_RESULTS:
                 break
 
-            title_tag = result.find('a', class_='result__a')
+            title_tag = result.css_first('a.result__a')
             if not title_tag:
                 continue
-            
-            link = title_tag['href']
-            snippet_tag = result.find('a', class_='result__snippet')
-            snippet = snippet_tag.text.strip() if snippet_tag else 'No description available'
+
+            link = title_tag.attributes.get('href')
+            snippet_tag = result.css_first('a.result__snippet')
+            snippet = snippet_tag.text(strip=True) if snippet_tag else 'No description available'
 
             results.append({
-                'id': i,
+                'id': len(results),
                 'link': link,
                 'search_description': snippet
             })
 
         logger.info(f'Found {len(results)} search results')
+        if _DDG_CACHE is not None:
+            with _DDG_LOCK:
+                _DDG_CACHE[cache_key] = copy.deepcopy(results)
         return results
     except Exception as e:
         logger.error(f'Error in DuckDuckGo search: {e}')
         return []
 
-def best_search_results(s_results: List[Dict], query: str) -> int:
+async def best_search_results(s_results: List[Dict], query: str) -> int:
     """
     Select the best search result from the list based on relevance.
-    
+
+    Scores each result's search_description against the query with BM25,
+    which is orders of magnitude cheaper than asking the LLM to emit an
+    index. Set LLM_RERANK=1 to use the llama3.2 picker instead.
+
     Args:
         s_results (List[Dict]): List of search results
         query (str): Original search query
-        
+
     Returns:
         int: Index of the best search result
     """
     if not s_results:
         return 0
-        
+
+    if LLM_RERANK:
+        return await _llm_best_search_result(s_results, query)
+
+    try:
+        corpus = [r['search_description'].lower().split() for r in s_results]
+        bm25 = BM25Okapi(corpus)
+        scores = bm25.get_scores(query.lower().split())
+        return int(max(range(len(s_results)), key=lambda i: scores[i]))
+    except Exception as e:
+        logger.error(f'Error scoring results with BM25: {e}')
+        return 0
+
+async def _llm_best_search_result(s_results: List[Dict], query: str) -> int:
+    """
+    LLM fallback picker: ask llama3.2 for the index of the best result.
+
+    Args:
+        s_results (List[Dict]): List of search results
+        query (str): Original search query
+
+    Returns:
+        int: Index of the best search result
+    """
     sys_msg = sys_msgs.best_search_result_selector_agent
     best_msg = f'SEARCH_RESULTS: {s_results} \nUSER_PROMPT: {assistant_convo[-1]["content"]} \nSEARCH_QUERY: {query}'
 
-    for attempt in range(3):
-        try:
-            response = ollama.chat(
-                model="llama3.2",
-                messages=[sys_msg, {'role': 'user', 'content': best_msg}]
-            )
-            index = int(response['message']['content'])
-            return min(index, len(s_results) - 1)  # Ensure index is within bounds
-        except Exception as e:
-            logger.error(f'Error selecting best result (attempt {attempt + 1}): {e}')
-    return 0
+    try:
+        response = await _OLLAMA.chat(
+            model="llama3.2",
+            messages=[sys_msg, {'role': 'user', 'content': best_msg}],
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            format=_INDEX_FORMAT,
+            options={'num_predict': 2}
+        )
+        index = int(response['message']['content'])
+        return min(index, len(s_results) - 1)  # Ensure index is within bounds
+    except Exception as e:
+        logger.error(f'Error selecting best result: {e}')
+        return 0
 
 def scrape_page(page_link: str) -> Optional[str]:
     """
@@ -195,138 +469,377 @@ def scrape_page(page_link: str) -> Optional[str]:
     Returns:
         Optional[str]: Scraped content if successful, None otherwise
     """
+    with _PAGE_LOCK:
+        cached = _PAGE_CACHE.get(page_link)
+        if cached is not None:
+            return cached
+        if page_link in _PAGE_MISS_CACHE:
+            return None
+
+    return _single_flight(f'page:{page_link}', lambda: _fetch_page_text(page_link))
+
+def _fetch_page_text(page_link: str) -> Optional[str]:
+    """
+    Download and extract a page's text, populating the page caches.
+
+    Args:
+        page_link (str): URL of the page to scrape
+
+    Returns:
+        Optional[str]: Extracted content if successful, None otherwise
+    """
     try:
-        downloaded = trafilatura.fetch_url(page_link)
-        if not downloaded:
+        page_response = _HTTP.get(page_link)
+        if page_response.status_code != 200 or not page_response.text:
+            with _PAGE_LOCK:
+                _PAGE_MISS_CACHE[page_link] = True
             return None
-        result = trafilatura.extract(downloaded, include_formatting=True)
+        result = _extract_pool().submit(_extract_text, page_response.text).result()
+        with _PAGE_LOCK:
+            if result:
+                _PAGE_CACHE[page_link] = result
+            else:
+                _PAGE_MISS_CACHE[page_link] = True
         return result
     except Exception as e:
         logger.error(f'Failed to scrape page {page_link}: {e}')
         return None
 
-def ai_search() -> Optional[str]:
+async def ai_search_async() -> Optional[str]:
     """
     Perform an AI-powered web search based on the conversation context.
-    
+
+    The top candidates are scraped concurrently in worker threads and
+    validated in completion order, so wall time tracks the slowest page
+    instead of a serial pick-scrape-validate loop.
+
     Returns:
         Optional[str]: Relevant content if found, None otherwise
     """
     try:
         logger.info('Starting search process')
-        search_query = query_generator().replace('"', '')
+        search_query = (await query_generator()).replace('"', '')
 
         print(f'SEARCH_QUERY: {search_query}')
-        
-        search_results = search_duckduckgo(search_query)
+
+        search_results = await asyncio.to_thread(search_duckduckgo, search_query)
         if not search_results:
             logger.warning('No search results found')
             return None
 
-        max_attempts = 5
-        for attempt in range(max_attempts):
-            best_result_index = best_search_results(s_results=search_results, query=search_query)
-            
-            if best_result_index >= len(search_results):
-                logger.warning(f'Invalid result index: {best_result_index}')
-                continue
-                
-            page_link = search_results[best_result_index]['link']
-            page_text = scrape_page(page_link)
-
-            
-            if page_text and contain_data_needed(search_content=page_text, query=search_query):
-                logger.info('Found relevant content')
+        # Cheap rerank: move the best-scoring candidate to the front so
+        # its scrape and validation start ahead of the rest.
+        best_index = await best_search_results(s_results=search_results, query=search_query)
+        if 0 < best_index < len(search_results):
+            search_results.insert(0, search_results.pop(best_index))
+
+        max_candidates = 5
+        candidates = search_results[:max_candidates]
+
+        # Each candidate is scraped and validated in its own task, so the
+        # validator calls overlap each other (and the slower scrapes)
+        # instead of queueing one LLM round trip per page. Run Ollama
+        # with OLLAMA_NUM_PARALLEL > 1 to overlap the LLM calls on the
+        # server side too.
+        async def evaluate_candidate(result: Dict) -> Optional[str]:
+            page_text = await asyncio.to_thread(scrape_page, result['link'])
+            if page_text and await contain_data_needed(search_content=page_text, query=search_query):
                 return page_text
-                
-            search_results.pop(best_result_index)
-            
-        logger.warning(f'Could not find relevant content after {max_attempts} attempts')
+            return None
+
+        tasks = [asyncio.create_task(evaluate_candidate(r)) for r in candidates]
+        try:
+            for completed in asyncio.as_completed(tasks):
+                page_text = await completed
+                if page_text:
+                    logger.info('Found relevant content')
+                    return page_text
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        logger.warning(f'No relevant content in top {len(candidates)} results')
         return None
-        
+
     except Exception as e:
         logger.error(f'Error in search process: {e}')
         return None
 
-def contain_data_needed(search_content: str, query: str) -> bool:
+# Cap what the validator LLM sees: prefill cost scales linearly with
+# input tokens, and a 50KB article is thousands of tokens of mostly
+# irrelevant prose.
+VALIDATOR_MAX_PARAGRAPHS = 8
+VALIDATOR_MAX_CHARS = 2000
+
+# Memoize validator verdicts: retries and cache rehydration can re-judge
+# the same (page, query) pair, and hashing the page is ~free next to the
+# LLM call it avoids.
+_VALIDATOR_CACHE = TTLCache(maxsize=1024, ttl=900)
+_VALIDATOR_LOCK = Lock()
+
+def _most_relevant_excerpt(search_content: str, query: str) -> str:
+    """
+    Reduce page text to its most query-relevant paragraphs.
+
+    Splits on blank lines, scores each paragraph against the query with
+    BM25 and concatenates the top scorers (kept in document order) up to
+    the configured caps.
+
+    Args:
+        search_content (str): Full scraped page text
+        query (str): Original search query
+
+    Returns:
+        str: Truncated excerpt for the validator prompt
+    """
+    paragraphs = [p.strip() for p in search_content.split('\n\n') if p.strip()]
+    if len(paragraphs) <= 1:
+        return search_content[:VALIDATOR_MAX_CHARS]
+
+    try:
+        bm25 = BM25Okapi([p.lower().split() for p in paragraphs])
+        scores = bm25.get_scores(query.lower().split())
+    except Exception as e:
+        logger.error(f'Error scoring paragraphs with BM25: {e}')
+        return search_content[:VALIDATOR_MAX_CHARS]
+
+    ranked = sorted(range(len(paragraphs)), key=lambda i: scores[i], reverse=True)
+    keep = sorted(ranked[:VALIDATOR_MAX_PARAGRAPHS])
+
+    excerpt = []
+    total = 0
+    for i in keep:
+        excerpt.append(paragraphs[i])
+        total += len(paragraphs[i])
+        if total >= VALIDATOR_MAX_CHARS:
+            break
+    return '\n\n'.join(excerpt)[:VALIDATOR_MAX_CHARS]
+
+async def contain_data_needed(search_content: str, query: str) -> bool:
     """
     Check if the scraped content contains the information needed.
-    
+
+    Only the most query-relevant excerpt of the page is sent to the
+    validator LLM; the full text is still what ai_search_async returns.
+
     Args:
         search_content (str): Scraped webpage content
         query (str): Original search query
-        
+
     Returns:
         bool: True if content is relevant, False otherwise
     """
+    content_hash = hashlib.blake2b(search_content.encode(), digest_size=16).hexdigest()
+    cache_key = (content_hash, query.strip().lower())
+    with _VALIDATOR_LOCK:
+        cached = _VALIDATOR_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
     sys_msg = sys_msgs.page_content_validator_agent
-    page_content_msg = f'PAGE_TEXT: {search_content} \nUSER_PROMPT: {assistant_convo[-1]["content"]} \nSEARCH_QUERY: {query}'
+    page_excerpt = _most_relevant_excerpt(search_content, query)
+    page_content_msg = f'PAGE_TEXT: {page_excerpt} \nUSER_PROMPT: {assistant_convo[-1]["content"]} \nSEARCH_QUERY: {query}'
 
     try:
-        response = ollama.chat(
+        response = await _OLLAMA.chat(
             model="llama3.2",
-            messages=[sys_msg, {'role': 'user', 'content': page_content_msg}]
+            messages=[sys_msg, {'role': 'user', 'content': page_content_msg}],
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            format=_BOOL_FORMAT,
+            options={'num_predict': 4}
         )
-        return 'true' in response['message']['content'].lower()
+        relevant = 'true' in response['message']['content'].lower()
+        with _VALIDATOR_LOCK:
+            _VALIDATOR_CACHE[cache_key] = relevant
+        return relevant
     except Exception as e:
         logger.error(f'Error validating content: {e}')
         return False
 
-def stream_assistant_response() -> None:
+async def trim_assistant_convo() -> None:
+    """
+    Bound conversation growth with a rolling window plus a summary.
+
+    Keeps the assistant system prompt and the most recent exchanges;
+    everything older is compressed into one synthetic system message so
+    long chats keep their earlier context without re-sending every turn.
+    """
+    global assistant_convo
+    if len(assistant_convo) <= 1 + MAX_CONVO_MESSAGES:
+        return
+
+    dropped = assistant_convo[1:-MAX_CONVO_MESSAGES]
+    kept = assistant_convo[-MAX_CONVO_MESSAGES:]
+    transcript = '\n'.join(f"{m['role']}: {m['content']}" for m in dropped)
+
+    summary = None
+    try:
+        response = await _OLLAMA.chat(
+            model="llama3.2",
+            messages=[sys_msgs.conversation_summarizer_agent, {'role': 'user', 'content': transcript}],
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            options={'num_ctx': OLLAMA_NUM_CTX}
+        )
+        summary = response['message']['content'].strip()
+    except Exception as e:
+        logger.error(f'Error summarizing conversation: {e}')
+
+    new_convo = [assistant_convo[0]]
+    if summary:
+        new_convo.append({'role': 'system', 'content': f'Earlier conversation summary: {summary}'})
+    assistant_convo = new_convo + kept
+    logger.info(f'Trimmed conversation to {len(assistant_convo)} messages')
+
+# Flush the token stream in batches: a write+flush syscall per token
+# adds up at 50-100 tokens/s, and a short time bound keeps interactive
+# output feeling live.
+STREAM_FLUSH_TOKENS = 64
+STREAM_FLUSH_INTERVAL = 0.05
+
+async def stream_assistant_response() -> None:
     """
     Stream the AI assistant's response to the console and update conversation history.
     """
     global assistant_convo
     try:
-        response_stream = ollama.chat(model="llama3.2", messages=assistant_convo, stream=True)
-        complete_response = ""
+        response_stream = await _OLLAMA.chat(
+            model="llama3.2", messages=assistant_convo, stream=True,
+            keep_alive=OLLAMA_KEEP_ALIVE,
+            options={'num_ctx': OLLAMA_NUM_CTX}
+        )
+        parts: List[str] = []
+        pending = 0
+        last_flush = time.monotonic()
         print(f"{Fore.GREEN}Assistant:{Style.RESET_ALL}")
 
-        for chunk in response_stream:
+        async for chunk in response_stream:
             chunk_content = chunk['message']['content']
-            print(chunk_content, end="", flush=True)
-            complete_response += chunk_content
-
-        assistant_convo.append({'role': 'assistant', 'content': complete_response})
+            parts.append(chunk_content)
+            sys.stdout.write(chunk_content)
+            pending += 1
+
+            now = time.monotonic()
+            if _STDOUT_IS_TTY and (
+                pending >= STREAM_FLUSH_TOKENS
+                or now - last_flush >= STREAM_FLUSH_INTERVAL
+            ):
+                sys.stdout.flush()
+                pending = 0
+                last_flush = now
+
+        sys.stdout.flush()
+        assistant_convo.append({'role': 'assistant', 'content': ''.join(parts)})
         print('\n\n')
     except Exception as e:
         logger.error(f'Error streaming response: {e}')
         print(f"{Fore.RED}Error: Could not generate response{Style.RESET_ALL}\n")
 
-def main() -> None:
+# Bytes read from stdin past the first newline, carried over between
+# prompt reads (only the single reader thread touches this).
+_STDIN_BUFFER = bytearray()
+
+async def _read_prompt(prompt: str) -> str:
     """
-    Main function that runs the interactive chat loop with AI-powered search capabilities.
+    Read one line of user input on a daemon thread.
+
+    asyncio.to_thread runs on the default executor, whose worker threads
+    are joined during event-loop shutdown — a Ctrl-C with stdin still
+    open would pin shutdown until the user pressed Enter. A daemon
+    thread lets the process exit immediately.
+
+    Args:
+        prompt (str): Prompt string shown to the user
+
+    Returns:
+        str: The line read from stdin
+    """
+    loop = asyncio.get_running_loop()
+    fut = loop.create_future()
+    print(prompt, end='', flush=True)
+
+    def deliver(line, exc):
+        if fut.cancelled():
+            return
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(line)
+
+    def post(line, exc):
+        try:
+            loop.call_soon_threadsafe(deliver, line, exc)
+        except RuntimeError:
+            # Loop already closed (shutdown mid-read); nothing to deliver.
+            pass
+
+    def reader():
+        # Raw os.read instead of input(): a daemon thread blocked inside
+        # input() holds the stdin buffer lock and aborts interpreter
+        # shutdown when the std streams get flushed. Bytes past the
+        # first newline (piped input) are kept for the next prompt.
+        global _STDIN_BUFFER
+        try:
+            while b'\n' not in _STDIN_BUFFER:
+                data = os.read(sys.stdin.fileno(), 1024)
+                if not data:
+                    if not _STDIN_BUFFER:
+                        raise EOFError
+                    break
+                _STDIN_BUFFER += data
+            line_bytes, _, rest = bytes(_STDIN_BUFFER).partition(b'\n')
+            _STDIN_BUFFER = bytearray(rest)
+            line = line_bytes.decode(errors='replace')
+        except BaseException as e:
+            post(None, e)
+        else:
+            post(line, None)
+
+    Thread(target=reader, daemon=True).start()
+    return await fut
+
+async def main_async() -> None:
+    """
+    Coroutine that runs the interactive chat loop with AI-powered search capabilities.
     """
     global assistant_convo
-    logger.info('Starting chat application')
 
     while True:
         try:
-            prompt = input(f'{Fore.YELLOW}You: \n{Style.RESET_ALL}')
+            prompt = await _read_prompt(f'{Fore.YELLOW}You: \n{Style.RESET_ALL}')
             if not prompt.strip():
                 continue
-                
+
             assistant_convo.append({'role': 'user', 'content': prompt})
 
-            if check_search_or_not():
-                context = ai_search()
+            if await check_search_or_not():
+                context = await ai_search_async()
                 assistant_convo.pop()  # Remove the original prompt
 
                 if context:
                     prompt = f'SEARCH_RESULT: {context} \nUSER_PROMPT: {prompt}'
                 else:
                     prompt = sys_msgs.SEARCH_FAILURE_PROMPT_TEMPLATE.format(prompt=prompt)
-                    
+
                 assistant_convo.append({'role': 'user', 'content': prompt})
 
-            stream_assistant_response()
-            
-        except KeyboardInterrupt:
-            logger.info('Shutting down chat application')
+            await stream_assistant_response()
+            await trim_assistant_convo()
+
+        except EOFError:
             break
         except Exception as e:
             logger.error(f'Error in main loop: {e}')
             print(f"{Fore.RED}An error occurred. Please try again.{Style.RESET_ALL}\n")
 
+def main() -> None:
+    """
+    Main function that runs the chat loop on an asyncio event loop.
+    """
+    logger.info('Starting chat application')
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        logger.info('Shutting down chat application')
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -74,6 +74,18 @@ page_content_validator_agent = {
     )
 }
 
+conversation_summarizer_agent = {
+    'role': 'system',
+    'content': (
+        'You are not an AI assistant that responds to a user. You are an AI model that compresses the older part '
+        'of a conversation between a user and an AI assistant so the assistant can keep responding coherently '
+        'without re-reading every turn. You will receive a transcript of earlier messages, each prefixed with its '
+        'role. Produce a short summary (at most 150 words) that preserves the facts, decisions, preferences and '
+        'open questions an assistant would need to continue the conversation naturally. Write plain prose only - '
+        'no headers, no bullet points, no commentary about the summarization task itself.'
+    )
+}
+
 SEARCH_FAILURE_PROMPT_TEMPLATE = (
     'USER PROMPT: \n{prompt} \n\nFAILED SEARCH: \nThe '
     'AI search model was unable to extract any reliable data. Explain that '